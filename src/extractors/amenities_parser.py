@@ -1,48 +1,109 @@
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup
+from .dom import DOM
 
 logger = logging.getLogger(__name__)
 
-def _find_amenities_sections(soup: BeautifulSoup) -> List[Any]:
+_HEADING_TAGS = ("h2", "h3", "h4")
+# Airbnb sometimes shows unavailable amenities with text like "Not included".
+_UNAVAILABLE_RE = re.compile(r"not available|unavailable|not included", re.IGNORECASE)
+
+def _find_amenities_sections(dom: DOM) -> List[Tuple[Any, Optional[str]]]:
+    """
+    Locate amenities blocks in a single walk over sections and headings.
+
+    Returns ``(section, heading)`` pairs where ``heading`` is the section's first
+    ``h2`` (else ``h3``, else ``h4``) text, or ``None`` if it has none.
+    """
+    all_sections: List[Any] = []
+    # dom.key(section) -> {heading tag: text of its first such heading}
+    section_headings: Dict[int, Dict[str, str]] = {}
     sections: List[Any] = []
+    seen: Set[int] = set()
+
+    for node in dom.find_all(dom.root, ("section", *_HEADING_TAGS)):
+        tag = dom.tag(node)
+        if tag == "section":
+            all_sections.append(node)
+            continue
+
+        text = dom.text(node)
+        nearest_section: Optional[Any] = None
+        ancestor = dom.parent(node)
+        while ancestor is not None:
+            if dom.tag(ancestor) == "section":
+                if nearest_section is None:
+                    nearest_section = ancestor
+                section_headings.setdefault(dom.key(ancestor), {}).setdefault(tag, text)
+            ancestor = dom.parent(ancestor)
 
-    # Common Airbnb pattern: heading "What this place offers" or "Amenities"
-    for heading in soup.find_all(["h2", "h3"]):
-        text = heading.get_text(strip=True).lower()
-        if "amenities" in text or "what this place offers" in text:
-            section = heading.find_parent("section") or heading.parent
-            if section and section not in sections:
+        if tag == "h4":
+            continue
+        # Common Airbnb pattern: heading "What this place offers" or "Amenities"
+        lower = text.lower()
+        if "amenities" in lower or "what this place offers" in lower:
+            section = nearest_section if nearest_section is not None else dom.parent(node)
+            if section is not None and dom.key(section) not in seen:
+                seen.add(dom.key(section))
                 sections.append(section)
 
     # Fallback: any section with "Amenities" somewhere in text.
     if not sections:
-        for section in soup.find_all("section"):
-            if "amenities" in section.get_text(" ", strip=True).lower():
+        for section in all_sections:
+            # Plain lower() + "in" beats an IGNORECASE regex on long section text.
+            if "amenities" in dom.text(section, " ").lower():
                 sections.append(section)
 
-    return sections
+    found: List[Tuple[Any, Optional[str]]] = []
+    for section in sections:
+        headings = section_headings.get(dom.key(section))
+        if headings is None:
+            # The heading's parent was not a <section>, so it was not indexed above.
+            headings = {}
+            for tag_name in _HEADING_TAGS:
+                heading_tag = dom.find(section, (tag_name,))
+                if heading_tag is not None:
+                    headings[tag_name] = dom.text(heading_tag)
+                    break
+        heading = next((headings[tag] for tag in _HEADING_TAGS if tag in headings), None)
+        found.append((section, heading))
+
+    return found
 
-def _parse_amenity_list(section: Any) -> List[Dict[str, Any]]:
+def _amenity_value(title: str) -> Dict[str, Any]:
+    return {
+        "title": title,
+        "available": not _UNAVAILABLE_RE.search(title),
+    }
+
+def _parse_amenity_list(dom: DOM, section: Any) -> List[Dict[str, Any]]:
     values: List[Dict[str, Any]] = []
-    for li in section.find_all("li"):
-        title = li.get_text(" ", strip=True)
-        if not title:
+    for li in dom.find_all(section, ("li",)):
+        title = dom.text(li, " ")
+        if title:
+            values.append(_amenity_value(title))
+    return values
+
+def _group_amenities(
+    sections: Iterable[Tuple[Optional[str], List[Dict[str, Any]]]],
+) -> List[Dict[str, Any]]:
+    """Build amenity groups from ``(heading, values)`` pairs, merging groups with the same title."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for heading, values in sections:
+        if not values:
             continue
+        title = heading or "Amenities"
+        existing = merged.get(title)
+        if not existing:
+            merged[title] = {"title": title, "values": list(values)}
+        else:
+            existing["values"].extend(values)
 
-        lower = title.lower()
-        # Airbnb sometimes shows unavailable amenities with text like "Not included".
-        unavailable = "not available" in lower or "unavailable" in lower or "not included" in lower
-        values.append(
-            {
-                "title": title,
-                "available": not unavailable,
-            },
-        )
-    return values
+    return list(merged.values())
 
-def extract_amenities(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+def extract_amenities(dom: DOM) -> List[Dict[str, Any]]:
     """
     Extract amenities into a normalized structure:
 
@@ -57,40 +118,11 @@ def extract_amenities(soup: BeautifulSoup) -> List[Dict[str, Any]]:
       ...
     ]
     """
-    sections = _find_amenities_sections(soup)
+    sections = _find_amenities_sections(dom)
     if not sections:
         logger.debug("No amenities sections detected.")
         return []
 
-    grouped: List[Dict[str, Any]] = []
-
-    for section in sections:
-        heading: Optional[str] = None
-        # Try to find the nearest heading for this section.
-        for tag_name in ("h2", "h3", "h4"):
-            heading_tag = section.find(tag_name)
-            if heading_tag:
-                heading = heading_tag.get_text(strip=True)
-                break
-
-        title = heading or "Amenities"
-        values = _parse_amenity_list(section)
-        if values:
-            grouped.append(
-                {
-                    "title": title,
-                    "values": values,
-                },
-            )
-
-    # Merge groups with the same title.
-    merged: Dict[str, Dict[str, Any]] = {}
-    for group in grouped:
-        key = group["title"]
-        existing = merged.get(key)
-        if not existing:
-            merged[key] = {"title": key, "values": list(group["values"])}
-        else:
-            existing["values"].extend(group["values"])
-
-    return list(merged.values())
\ No newline at end of file
+    return _group_amenities(
+        (heading, _parse_amenity_list(dom, section)) for section, heading in sections
+    )
\ No newline at end of file
@@ -0,0 +1,168 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if it is not installed.
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# selectolax parses and queries in C and is used when installed. BeautifulSoup remains
+# the fallback for environments without it, and for pages lexbor fails to parse.
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+except ImportError:
+    LexborHTMLParser = None
+    SelectolaxError = None
+
+class DOM(ABC):
+    """
+    The handful of tree operations the extractors need, so the same extraction
+    code runs on a BeautifulSoup or a selectolax tree. Text follows
+    BeautifulSoup's ``get_text(separator, strip=True)`` semantics on both.
+    """
+
+    root: Any
+
+    @abstractmethod
+    def find_all(self, node: Any, names: Sequence[str]) -> List[Any]:
+        """Descendants of ``node`` with one of the tag ``names``, in document order."""
+
+    @abstractmethod
+    def find(self, node: Any, names: Sequence[str]) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def tag(self, node: Any) -> str:
+        ...
+
+    @abstractmethod
+    def parent(self, node: Any) -> Optional[Any]:
+        """Parent element of ``node``, or ``None`` above the top-level element."""
+
+    @abstractmethod
+    def key(self, node: Any) -> int:
+        """Stable identity of ``node`` within this tree, usable as a dict key."""
+
+    @abstractmethod
+    def strings(self, node: Any) -> List[str]:
+        """Stripped, non-empty text pieces under ``node``, excluding script/style."""
+
+    @abstractmethod
+    def string(self, node: Any) -> Optional[str]:
+        """Text of ``node`` if it holds a single string, like ``Tag.string``."""
+
+    @abstractmethod
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        ...
+
+    def text(self, node: Any, separator: str = "") -> str:
+        return separator.join(self.strings(node))
+
+class SoupDOM(DOM):
+    def __init__(self, html: str) -> None:
+        soup = BeautifulSoup(html, HTML_PARSER)
+        # Template contents are inert; drop them so they are invisible to find/find_all
+        # too, matching LexborDOM.
+        for template in soup.find_all("template"):
+            template.decompose()
+        self.root = soup
+
+    def find_all(self, node: Any, names: Sequence[str]) -> List[Any]:
+        return node.find_all(list(names))
+
+    def find(self, node: Any, names: Sequence[str]) -> Optional[Any]:
+        return node.find(list(names))
+
+    def tag(self, node: Any) -> str:
+        return node.name
+
+    def parent(self, node: Any) -> Optional[Any]:
+        parent = node.parent
+        # Never hand out the document object itself as a container.
+        if parent is None or isinstance(parent, BeautifulSoup):
+            return None
+        return parent
+
+    def key(self, node: Any) -> int:
+        return id(node)
+
+    def strings(self, node: Any) -> List[str]:
+        return list(node.stripped_strings)
+
+    def string(self, node: Any) -> Optional[str]:
+        return node.string
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.get(name)
+
+class LexborDOM(DOM):
+    def __init__(self, html: str) -> None:
+        tree = LexborHTMLParser(html)
+        # BeautifulSoup leaves script/style contents out of get_text(); templates are
+        # removed from both backends.
+        tree.strip_tags(["script", "style", "template"])
+        self.tree = tree
+        self.root = tree.root
+
+    def find_all(self, node: Any, names: Sequence[str]) -> List[Any]:
+        # Compare mem_id: LexborNode.__eq__ compares serialized HTML, which is far too slow here.
+        node_id = node.mem_id
+        return [match for match in node.css(", ".join(names)) if match.mem_id != node_id]
+
+    def find(self, node: Any, names: Sequence[str]) -> Optional[Any]:
+        node_id = node.mem_id
+        for match in node.css(", ".join(names)):
+            if match.mem_id != node_id:
+                return match
+        return None
+
+    def tag(self, node: Any) -> str:
+        return node.tag
+
+    def parent(self, node: Any) -> Optional[Any]:
+        parent = node.parent
+        if parent is None or parent.is_document_node:
+            return None
+        return parent
+
+    def key(self, node: Any) -> int:
+        return node.mem_id
+
+    def strings(self, node: Any) -> List[str]:
+        pieces: List[str] = []
+        for child in node.traverse(include_text=True):
+            if child.is_text_node:
+                piece = child.text_content.strip()
+                if piece:
+                    pieces.append(piece)
+        return pieces
+
+    def string(self, node: Any) -> Optional[str]:
+        child = node.child
+        # Descend through single-child elements, as Tag.string does.
+        while child is not None and child.next is None:
+            if child.is_text_node:
+                return child.text_content
+            child = child.child
+        return None
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+def parse_dom(html: str, url: str) -> DOM:
+    """Parse ``html`` with selectolax when available, else with BeautifulSoup."""
+    if LexborHTMLParser is not None:
+        try:
+            return LexborDOM(html)
+        except SelectolaxError as exc:
+            logger.warning("selectolax could not parse %s (%s), using BeautifulSoup.", url, exc)
+
+    return SoupDOM(html)
@@ -2,8 +2,6 @@ import logging
 import re
 from typing import Any, Dict, Optional
 
-from bs4 import BeautifulSoup
-
 logger = logging.getLogger(__name__)
 
 RATING_FIELDS = [
@@ -15,35 +13,43 @@ RATING_FIELDS = [
     "value",
 ]
 
+_RATING_RE = re.compile(r"(\d\.\d{1,2})")
+_REVIEWS_RE = re.compile(r"(\d+)\s+review", re.IGNORECASE)
+# A subrating label followed by its score, e.g. "Cleanliness 4.9". The gap is short, holds no
+# digits and may not cross another label, so a label without a score of its own (e.g. "Great
+# value") never takes the score of the row after it.
+_LABELS = "|".join(RATING_FIELDS)
+_FIELDS_RE = re.compile(
+    r"\b(" + _LABELS + r")\b(?:(?!\b(?:" + _LABELS + r")\b)\D){0,40}?(\d\.\d{1,2})",
+    re.IGNORECASE,
+)
+
 def _parse_overall_rating_and_reviews(text: str) -> (Optional[float], Optional[int]):
     # Match patterns like "4.97 · 36 reviews"
-    rating_match = re.search(r"(\d\.\d{1,2})", text)
-    reviews_match = re.search(r"(\d+)\s+review", text, re.IGNORECASE)
+    rating_match = _RATING_RE.search(text)
+    reviews_match = _REVIEWS_RE.search(text)
 
     overall = float(rating_match.group(1)) if rating_match else None
     reviews = int(reviews_match.group(1)) if reviews_match else None
     return overall, reviews
 
-def _parse_subratings(soup: BeautifulSoup) -> Dict[str, Optional[float]]:
+def _parse_subratings(body_text: str) -> Dict[str, Optional[float]]:
+    """
+    >>> scores = _parse_subratings("Great value Accuracy 4.8")
+    >>> scores["accuracy"], scores["value"]
+    (4.8, None)
+    >>> _parse_subratings("Cleanliness 4.97 Location · 4.9")["location"]
+    4.9
+    """
     subratings: Dict[str, Optional[float]] = {field: None for field in RATING_FIELDS}
 
     # Airbnb often uses rows with a label and a score, e.g., "Cleanliness 4.9"
-    for row in soup.find_all(["div", "li"]):
-        text = row.get_text(" ", strip=True)
-        lower = text.lower()
-        for field in RATING_FIELDS:
-            if field in lower:
-                match = re.search(r"(\d\.\d{1,2})", text)
-                if match:
-                    try:
-                        subratings[field] = float(match.group(1))
-                    except ValueError:
-                        logger.debug("Unable to parse subrating from %r", text)
-                break
+    for match in _FIELDS_RE.finditer(body_text):
+        subratings[match.group(1).lower()] = float(match.group(2))
 
     return subratings
 
-def extract_ratings(soup: BeautifulSoup) -> Dict[str, Any]:
+def extract_ratings(body_text: str) -> Dict[str, Any]:
     """
     Extract ratings into a normalized structure:
 
@@ -57,11 +63,12 @@ def extract_ratings(soup: BeautifulSoup) -> Dict[str, Any]:
       "guestSatisfaction": 4.97,
       "reviewsCount": 36
     }
+
+    ``body_text`` is the page text flattened with single-space separators.
     """
-    body_text = soup.get_text(" ", strip=True)
     overall, reviews_count = _parse_overall_rating_and_reviews(body_text)
 
-    subratings = _parse_subratings(soup)
+    subratings = _parse_subratings(body_text)
 
     # Guest satisfaction can be approximated as overall rating when available.
     guest_satisfaction = overall
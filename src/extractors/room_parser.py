@@ -1,15 +1,21 @@
 import logging
-import time
+import re
 from typing import Any, Dict, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
 
 from .amenities_parser import extract_amenities
+from .dom import DOM, parse_dom
 from .ratings_parser import extract_ratings
 
 logger = logging.getLogger(__name__)
 
+# A standalone number followed by a word containing "guest", e.g. "4 guests" or "4 (guests)".
+_CAPACITY_RE = re.compile(r"(?<!\S)(\d+)\s+\S*guest", re.IGNORECASE)
+_HOSTED_BY_RE = re.compile(r"hosted by", re.IGNORECASE)
+_HOST_NAME_RE = re.compile(r"Hosted by\s+(\S+)")
+_PRICE_RE = re.compile(r"([$€£₹¥])\s*(\d[\d,]*(?:\.\d+)?)")
+
 class RoomScrapeError(Exception):
     """Raised when scraping a single room fails in a non-recoverable way."""
 
@@ -18,82 +24,57 @@ def fetch_room_html(
     session: requests.Session,
     headers: Dict[str, str],
     timeout: float,
-    max_retries: int,
 ) -> str:
-    """Fetch room HTML with simple retry logic."""
-    last_exc: Optional[Exception] = None
-
-    for attempt in range(1, max_retries + 2):
-        try:
-            logger.debug("Fetching %s (attempt %d)", url, attempt)
-            response = session.get(url, headers=headers, timeout=timeout)
-            if response.status_code == 200:
-                return response.text
-
-            logger.warning(
-                "Non-200 status %s for %s on attempt %d",
-                response.status_code,
-                url,
-                attempt,
-            )
-        except requests.RequestException as exc:
-            last_exc = exc
-            logger.warning("Request error for %s on attempt %d: %s", url, attempt, exc)
-
-        # Backoff between retries
-        if attempt <= max_retries:
-            time.sleep(1.0 * attempt)
-
-    raise RoomScrapeError(f"Failed to fetch {url}") from last_exc
-
-def _safe_get_text(node: Optional[Any]) -> str:
-    if not node:
-        return ""
-    return node.get_text(strip=True)
-
-def parse_property_type(soup: BeautifulSoup) -> Optional[str]:
+    """
+    Fetch room HTML. Retries and backoff are handled by the adapter mounted on
+    ``session``, so a single call is made here.
+    """
+    logger.debug("Fetching %s", url)
+    try:
+        response = session.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        # Callers log the URL alongside this message, so it is not repeated here.
+        raise RoomScrapeError(str(exc)) from exc
+
+    # Airbnb serves UTF-8. Without a declared charset requests would otherwise guess,
+    # either defaulting to ISO-8859-1 or running charset detection over the whole body.
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        response.encoding = "utf-8"
+    return response.text
+
+def parse_property_type(dom: DOM) -> Optional[str]:
     # Try known patterns first: title might contain property type.
-    title_tag = soup.find("title")
-    if title_tag and "-" in title_tag.text:
-        title_text = title_tag.text.split("-")[0].strip()
-        if title_text:
-            return title_text
+    title_tag = dom.find(dom.root, ("title",))
+    if title_tag is not None:
+        title = dom.text(title_tag)
+        if "-" in title:
+            title_text = title.split("-")[0].strip()
+            if title_text:
+                return title_text
 
     # Fallback to heading text.
-    heading = soup.find(["h1", "h2"])
-    if heading:
-        text = heading.get_text(strip=True)
+    heading = dom.find(dom.root, ("h1", "h2"))
+    if heading is not None:
+        text = dom.text(heading)
         if text:
             return text
 
     return None
 
-def parse_person_capacity(soup: BeautifulSoup) -> Optional[int]:
+def parse_person_capacity(body_text: str) -> Optional[int]:
     # Look for text like "4 guests" or "up to 2 guests"
-    body_text = soup.get_text(" ", strip=True)
-    if not body_text:
-        return None
-
-    tokens = body_text.split()
-    for idx, token in enumerate(tokens):
-        if token.isdigit() and idx + 1 < len(tokens):
-            next_token = tokens[idx + 1].lower()
-            if "guest" in next_token:
-                try:
-                    return int(token)
-                except ValueError:
-                    continue
-    return None
+    match = _CAPACITY_RE.search(body_text)
+    return int(match.group(1)) if match else None
 
-def parse_highlights(soup: BeautifulSoup) -> List[Dict[str, str]]:
+def parse_highlights(body_text_nl: str) -> List[Dict[str, str]]:
     highlights: List[Dict[str, str]] = []
 
     # Heuristic: short bullet points near words like "Superhost", "Top", "Great location".
-    body_text = soup.get_text("\n", strip=True)
     candidates = []
-    for line in body_text.splitlines():
+    for line in body_text_nl.splitlines():
         lower = line.lower()
-        if any(keyword in lower for keyword in ("superhost", "top", "great location")):
+        if "superhost" in lower or "top" in lower or "great location" in lower:
             candidates.append(line.strip())
 
     for line in candidates:
@@ -110,78 +91,85 @@ def parse_highlights(soup: BeautifulSoup) -> List[Dict[str, str]]:
 
     return highlights
 
-def parse_images(soup: BeautifulSoup) -> List[Dict[str, str]]:
+def parse_images(dom: DOM) -> List[Dict[str, str]]:
     images: List[Dict[str, str]] = []
-    for img in soup.find_all("img"):
-        src = img.get("src") or img.get("data-src")
+    for img in dom.find_all(dom.root, ("img",)):
+        src = (dom.attr(img, "src") or dom.attr(img, "data-src") or "").strip()
         if not src:
             continue
-        caption = img.get("alt") or ""
+        caption = (dom.attr(img, "alt") or "").strip()
         images.append({"url": src, "caption": caption})
     return images
 
-def parse_host_details(soup: BeautifulSoup) -> Dict[str, Any]:
+def _build_host_details(section_text: Optional[str], description: Optional[str]) -> Dict[str, Any]:
+    # Try to extract the name after "Hosted by"
+    match = _HOST_NAME_RE.search(section_text) if section_text else None
+
+    return {
+        "name": match.group(1) if match else None,
+        "description": description or None,
+    }
+
+def parse_host_details(dom: DOM) -> Dict[str, Any]:
     # This is a heuristic; Airbnb's DOM may differ.
     host_section = None
-    for heading in soup.find_all(["h2", "h3"]):
-        if heading.string and "hosted by" in heading.string.lower():
-            host_section = heading.parent
+    for heading in dom.find_all(dom.root, ("h2", "h3")):
+        heading_string = dom.string(heading)
+        if heading_string and _HOSTED_BY_RE.search(heading_string):
+            host_section = dom.parent(heading)
             break
 
-    host_name: Optional[str] = None
+    if host_section is None:
+        return _build_host_details(None, None)
+
     description: Optional[str] = None
+    paragraph = dom.find(host_section, ("p",))
+    if paragraph is not None:
+        description = dom.text(paragraph)
 
-    if host_section:
-        heading_text = host_section.get_text(" ", strip=True)
-        if "hosted by" in heading_text.lower():
-            # Try to extract the name after "Hosted by"
-            parts = heading_text.split("Hosted by")
-            if len(parts) > 1:
-                host_name = parts[1].strip().split()[0]
+    return _build_host_details(dom.text(host_section, " "), description)
 
-        paragraphs = host_section.find_all("p")
-        if paragraphs:
-            description = paragraphs[0].get_text(strip=True)
+def parse_price(body_text: str) -> Optional[Dict[str, Any]]:
+    # Earliest currency symbol that is followed by an amount, e.g. "$120" or "€ 1,250.50".
+    match = _PRICE_RE.search(body_text)
+    if not match:
+        return None
 
     return {
-        "name": host_name,
-        "description": description,
+        "currencySymbol": match.group(1),
+        "amount": float(match.group(2).replace(",", "")),
+        "raw": match.group(0),
     }
 
-def parse_price(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
-    body_text = soup.get_text(" ", strip=True)
-    currency_symbols = ["$", "€", "£", "₹", "¥"]
-
-    for sym in currency_symbols:
-        if sym in body_text:
-            idx = body_text.index(sym)
-            snippet = body_text[idx : idx + 20]
-            # Try to find a numeric sequence after the symbol.
-            digits = []
-            for ch in snippet[1:]:
-                if ch.isdigit() or ch in ",.":
-                    digits.append(ch)
-                else:
-                    break
-            amount_str = "".join(digits).replace(",", "")
-            try:
-                amount = float(amount_str)
-                return {
-                    "currencySymbol": sym,
-                    "amount": amount,
-                    "raw": snippet.strip(),
-                }
-            except ValueError:
-                continue
+def parse_room(html: str, url: str) -> Dict[str, Any]:
+    """
+    Parse fetched room HTML into a structured dictionary. Kept free of network
+    state so it can be dispatched to a worker process.
+    """
+    dom = parse_dom(html, url)
 
-    return None
+    # Flatten the page text once; several extractors scan it.
+    strings = dom.strings(dom.root)
+    body_text_space = " ".join(strings)
+    body_text_nl = "\n".join(strings)
+
+    return {
+        "url": url,
+        "propertyType": parse_property_type(dom),
+        "personCapacity": parse_person_capacity(body_text_space),
+        "rating": extract_ratings(body_text_space),
+        "amenities": extract_amenities(dom),
+        "highlights": parse_highlights(body_text_nl),
+        "images": parse_images(dom),
+        "hostDetails": parse_host_details(dom),
+        "price": parse_price(body_text_space),
+    }
 
 def scrape_room(
     url: str,
     session: requests.Session,
     headers: Dict[str, str],
     timeout: float,
-    max_retries: int,
 ) -> Dict[str, Any]:
     """
     High-level entry point that fetches a single room and parses all relevant
@@ -192,29 +180,5 @@ def scrape_room(
         session=session,
         headers=headers,
         timeout=timeout,
-        max_retries=max_retries,
     )
-    soup = BeautifulSoup(html, "html.parser")
-
-    property_type = parse_property_type(soup)
-    person_capacity = parse_person_capacity(soup)
-    amenities = extract_amenities(soup)
-    rating = extract_ratings(soup)
-    highlights = parse_highlights(soup)
-    images = parse_images(soup)
-    host_details = parse_host_details(soup)
-    price = parse_price(soup)
-
-    result: Dict[str, Any] = {
-        "url": url,
-        "propertyType": property_type,
-        "personCapacity": person_capacity,
-        "rating": rating,
-        "amenities": amenities,
-        "highlights": highlights,
-        "images": images,
-        "hostDetails": host_details,
-        "price": price,
-    }
-
-    return result
\ No newline at end of file
+    return parse_room(html, url)
\ No newline at end of file
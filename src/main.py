@@ -1,15 +1,28 @@
 import argparse
+import importlib.util
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from extractors.room_parser import scrape_room
+from extractors.room_parser import fetch_room_html, parse_room
 from utils.data_formatter import prepare_room_payload
 
+# orjson (de)serializes in native code; fall back to the stdlib when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_SETTINGS: Dict[str, Any] = {
@@ -17,8 +30,16 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
     "requestTimeout": 20,
     "maxRetries": 2,
     "maxWorkers": 4,
+    # None uses one process per CPU core, capped at the number of URLs.
+    "parseWorkers": None,
 }
 
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
 def configure_logging(verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
@@ -26,14 +47,12 @@ def configure_logging(verbose: bool = False) -> None:
         format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
     )
 
-def load_settings(settings_path: Path) -> Dict[str, Any]:
-    if not settings_path.exists():
-        logger.warning("Settings file %s not found, using defaults.", settings_path)
-        return DEFAULT_SETTINGS.copy()
-
+@lru_cache(maxsize=4)
+def _load_settings_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is part of the cache key only, so an edited file is re-read.
+    settings_path = Path(path_str)
     try:
-        with settings_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(settings_path)
     except Exception as exc:  # noqa: BLE001
         logger.error(
             "Failed to read settings file %s (%s). Using defaults.",
@@ -53,12 +72,32 @@ def load_settings(settings_path: Path) -> Dict[str, Any]:
     merged.update(data)
     return merged
 
+def load_settings(settings_path: Path) -> Dict[str, Any]:
+    try:
+        mtime_ns = settings_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        logger.warning("Settings file %s not found, using defaults.", settings_path)
+        return DEFAULT_SETTINGS.copy()
+
+    # Hand out a copy so callers cannot mutate the cached settings.
+    return _load_settings_cached(str(settings_path), mtime_ns).copy()
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a room URL for deduplication: lowercase scheme and host, sort the
+    query parameters and drop the fragment. Parameter encoding is left untouched.
+
+    Raises ``ValueError`` for URLs ``urlsplit`` cannot parse.
+    """
+    parts = urlsplit(url.strip())
+    query = "&".join(sorted(p for p in parts.query.split("&") if p))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
 def load_input(input_path: Path) -> List[str]:
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    with input_path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = _read_json(input_path)
 
     urls: List[str] = []
 
@@ -90,13 +129,60 @@ def load_input(input_path: Path) -> List[str]:
     if not urls:
         raise ValueError("No URLs found in the input file.")
 
-    logger.info("Loaded %d URL(s) from %s", len(urls), input_path)
-    return urls
+    # Drop duplicates so each room is scraped once. The canonical form is only the
+    # dedup key; the first original spelling of each URL is kept, in input order.
+    by_key: Dict[str, str] = {}
+    for url in urls:
+        try:
+            key = canonicalize_url(url)
+        except ValueError:
+            # Leave malformed URLs in; they fail individually at fetch time.
+            key = url.strip()
+        by_key.setdefault(key, url)
+    unique_urls = list(by_key.values())
+    if len(unique_urls) < len(urls):
+        logger.info("Skipping %d duplicate URL(s).", len(urls) - len(unique_urls))
+
+    logger.info("Loaded %d URL(s) from %s", len(unique_urls), input_path)
+    return unique_urls
+
+def build_session(max_workers: int, max_retries: int) -> requests.Session:
+    """
+    Build a single session shared by all workers so connections (and TLS
+    handshakes) are reused across URLs. Retries with exponential backoff are
+    delegated to urllib3.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=max_workers,
+        pool_maxsize=max_workers * 2,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _parse_pool_context() -> multiprocessing.context.BaseContext:
+    # The pool starts its workers while the fetch threads are mid-request, and fork()
+    # from a multi-threaded process can deadlock the child. Use a fresh interpreter instead.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
 
 def process_urls(urls: List[str], settings: Dict[str, Any]) -> List[Dict[str, Any]]:
     timeout = float(settings.get("requestTimeout", DEFAULT_SETTINGS["requestTimeout"]))
     max_retries = int(settings.get("maxRetries", DEFAULT_SETTINGS["maxRetries"]))
     max_workers = int(settings.get("maxWorkers", DEFAULT_SETTINGS["maxWorkers"]))
+    parse_workers = settings.get("parseWorkers", DEFAULT_SETTINGS["parseWorkers"])
+    # Never start more parse processes than there are pages to parse.
+    parse_workers = max(1, min(int(parse_workers or os.cpu_count() or 1), len(urls)))
     user_agent = str(settings.get("userAgent", DEFAULT_SETTINGS["userAgent"]))
 
     headers = {
@@ -113,22 +199,38 @@ def process_urls(urls: List[str], settings: Dict[str, Any]) -> List[Dict[str, An
 
     results: List[Dict[str, Any]] = []
 
-    def worker(url: str) -> Dict[str, Any]:
-        # A separate session per worker keeps thread safety simple.
-        with requests.Session() as session:
-            return scrape_room(
+    # Fetching is I/O-bound and stays on threads; parsing is CPU-bound and is
+    # handed to worker processes as soon as each page arrives so it runs on all
+    # cores, overlapping with the remaining downloads.
+    with build_session(max_workers, max_retries) as session, ThreadPoolExecutor(
+        max_workers=max_workers,
+    ) as fetch_pool, ProcessPoolExecutor(
+        max_workers=parse_workers,
+        mp_context=_parse_pool_context(),
+    ) as parse_pool:
+        fetch_futures = {
+            fetch_pool.submit(
+                fetch_room_html,
                 url=url,
                 session=session,
                 headers=headers,
                 timeout=timeout,
-                max_retries=max_retries,
-            )
+            ): url
+            for url in urls
+        }
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_url = {executor.submit(worker, url): url for url in urls}
+        parse_futures: Dict[Any, str] = {}
+        for future in as_completed(fetch_futures):
+            url = fetch_futures[future]
+            try:
+                html = future.result()
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Failed to fetch %s: %s", url, exc)
+                continue
+            parse_futures[parse_pool.submit(parse_room, html, url)] = url
 
-        for future in as_completed(future_to_url):
-            url = future_to_url[future]
+        for future in as_completed(parse_futures):
+            url = parse_futures[future]
             try:
                 raw_room = future.result()
                 if not raw_room:
@@ -143,10 +245,52 @@ def process_urls(urls: List[str], settings: Dict[str, Any]) -> List[Dict[str, An
     logger.info("Finished scraping. Successfully collected %d record(s).", len(results))
     return results
 
+def _save_parquet(output_path: Path, payload: List[Dict[str, Any]]) -> None:
+    # Imported lazily: pyarrow is optional and only needed for columnar output.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Transposes the per-room records into one column per field (nested fields
+    # become struct/list columns). The schema is fixed rather than inferred, so
+    # every run writes the same column types, even when a field is null on every
+    # page or the payload is empty.
+    title_values = pa.list_(pa.struct([("title", pa.string()), ("available", pa.bool_())]))
+    schema = pa.schema([
+        ("url", pa.string()),
+        ("propertyType", pa.string()),
+        ("personCapacity", pa.int64()),
+        ("rating", pa.struct([
+            ("accuracy", pa.float64()),
+            ("checking", pa.float64()),
+            ("cleanliness", pa.float64()),
+            ("communication", pa.float64()),
+            ("location", pa.float64()),
+            ("value", pa.float64()),
+            ("guestSatisfaction", pa.float64()),
+            ("reviewsCount", pa.int64()),
+        ])),
+        ("amenities", pa.list_(pa.struct([("title", pa.string()), ("values", title_values)]))),
+        ("highlights", pa.list_(pa.struct([("title", pa.string()), ("subtitle", pa.string())]))),
+        ("images", pa.list_(pa.struct([("url", pa.string()), ("caption", pa.string())]))),
+        ("hostDetails", pa.struct([("name", pa.string()), ("description", pa.string())])),
+        ("price", pa.struct([
+            ("currencySymbol", pa.string()),
+            ("amount", pa.float64()),
+            ("raw", pa.string()),
+        ])),
+    ])
+    table = pa.Table.from_pylist(payload, schema=schema)
+    pq.write_table(table, output_path)
+
 def save_output(output_path: Path, payload: List[Dict[str, Any]]) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    if output_path.suffix.lower() == ".parquet":
+        _save_parquet(output_path, payload)
+    elif orjson is not None:
+        output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with output_path.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
     logger.info("Wrote %d record(s) to %s", len(payload), output_path)
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -170,7 +314,10 @@ def build_arg_parser() -> argparse.ArgumentParser:
         "--output",
         type=Path,
         default=default_output,
-        help=f"Path to output JSON file (default: {default_output})",
+        help=(
+            "Path to output JSON file, or a .parquet file for columnar output "
+            f"(requires pyarrow; default: {default_output})"
+        ),
     )
     parser.add_argument(
         "-s",
@@ -193,6 +340,11 @@ def main() -> None:
 
     configure_logging(verbose=args.verbose)
 
+    # Fail before scraping rather than after, when the output cannot be written.
+    if args.output.suffix.lower() == ".parquet" and importlib.util.find_spec("pyarrow") is None:
+        logger.error("Writing %s requires pyarrow to be installed.", args.output)
+        raise SystemExit(1)
+
     try:
         settings = load_settings(args.settings)
     except Exception as exc:  # noqa: BLE001